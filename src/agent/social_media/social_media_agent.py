@@ -3,7 +3,7 @@ import json
 import logging
 import os
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 from browser_use.browser.browser import BrowserConfig
@@ -15,6 +15,27 @@ from src.controller.custom_controller import CustomController
 
 logger = logging.getLogger(__name__)
 
+SOCIAL_MEDIA_PROMPT_TEMPLATE = """
+Social Media Task: {task}
+{platform_instructions}
+
+You are a social media management specialist. Your capabilities include:
+- Creating and posting content
+- Monitoring engagement and mentions
+- Analyzing social media metrics
+- Managing multiple social media accounts
+- Scheduling posts for optimal timing
+
+Guidelines:
+1. Always respect platform terms of service
+2. Use appropriate hashtags and mentions
+3. Maintain brand voice and consistency
+4. Monitor for engagement opportunities
+5. Take screenshots of important metrics or posts
+
+Execute the task step by step, providing detailed feedback on each action.
+"""
+
 
 class SocialMediaAgent:
     """
@@ -51,6 +72,12 @@ class SocialMediaAgent:
         self.stopped = False
         self.stop_event = None
 
+        # Browser kept alive between runs when browser_config["keep_browser_open"]
+        self.browser: Optional[CustomBrowser] = None
+
+        # Save directories already created by _save_results
+        self._save_dirs_made: set = set()
+
         logger.info("SocialMediaAgent initialized")
 
     async def run(
@@ -93,12 +120,13 @@ class SocialMediaAgent:
         logger.info(f"Target platforms: {platforms or ['all']}")
         logger.info(f"Task ID: {self.current_task_id}")
 
-        # Initialize browser variable for cleanup
+        # Initialize browser variables for cleanup
         browser = None
+        context = None
 
         try:
-            # Create browser instance
-            browser = await self._create_browser()
+            # Reuse the kept-open browser if any; each task gets a fresh context
+            browser = await self._get_browser()
             context = await self._create_context(browser)
             controller = CustomController()
 
@@ -123,7 +151,7 @@ class SocialMediaAgent:
             final_result = result.final_result()
 
             # Save results
-            await self._save_results(final_result, save_dir)
+            timestamp = await self._save_results(final_result, save_dir)
 
             logger.info(f"Social media task completed: {self.current_task_id}")
 
@@ -132,7 +160,7 @@ class SocialMediaAgent:
                 "task_id": self.current_task_id,
                 "result": final_result,
                 "platforms": platforms,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
             }
 
         except Exception as e:
@@ -141,44 +169,21 @@ class SocialMediaAgent:
                 "status": "error",
                 "task_id": self.current_task_id,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
             }
         finally:
-            # Cleanup
-            try:
-                if browser:
-                    await browser.close()
-            except Exception as e:
-                logger.error(f"Error closing browser: {e}")
+            await self._release_browser(browser, context)
 
     def _create_social_media_prompt(self, task: str, platforms: list) -> str:
         """Create a specialized prompt for social media tasks."""
-        platform_instructions = ""
-        if platforms:
-            platform_instructions = (
-                f"\nFocus specifically on these platforms: {', '.join(platforms)}"
-            )
-
-        return f"""
-        Social Media Task: {task}
-        {platform_instructions}
-
-        You are a social media management specialist. Your capabilities include:
-        - Creating and posting content
-        - Monitoring engagement and mentions
-        - Analyzing social media metrics
-        - Managing multiple social media accounts
-        - Scheduling posts for optimal timing
-
-        Guidelines:
-        1. Always respect platform terms of service
-        2. Use appropriate hashtags and mentions
-        3. Maintain brand voice and consistency
-        4. Monitor for engagement opportunities
-        5. Take screenshots of important metrics or posts
-
-        Execute the task step by step, providing detailed feedback on each action.
-        """
+        platform_instructions = (
+            f"Focus specifically on these platforms: {', '.join(platforms)}"
+            if platforms
+            else ""
+        )
+        return SOCIAL_MEDIA_PROMPT_TEMPLATE.format(
+            task=task, platform_instructions=platform_instructions
+        )
 
     async def _create_browser(self) -> CustomBrowser:
         """Create browser instance with social media optimizations."""
@@ -207,6 +212,27 @@ class SocialMediaAgent:
         )
         return browser
 
+    async def _get_browser(self) -> CustomBrowser:
+        """Return the kept-open browser, or launch a new one."""
+        if self.browser:
+            return self.browser
+
+        browser = await self._create_browser()
+        if self.browser_config.get("keep_browser_open", False):
+            self.browser = browser
+        return browser
+
+    async def _release_browser(self, browser, context):
+        """Close the task's context, and the browser unless it is kept open."""
+        try:
+            if browser is not None and browser is self.browser:
+                if context:
+                    await context.close()
+            elif browser:
+                await browser.close()
+        except Exception as e:
+            logger.error(f"Error closing browser: {e}")
+
     async def _create_context(self, browser):
         """Create browser context for social media tasks."""
         context_config = BrowserContextConfig(
@@ -217,24 +243,37 @@ class SocialMediaAgent:
         )
         return await browser.new_context(config=context_config)
 
-    async def _save_results(self, result: str, save_dir: str):
-        """Save social media task results."""
+    async def _save_results(self, result: str, save_dir: str) -> str:
+        """
+        Save social media task results without blocking the event loop.
 
-        os.makedirs(save_dir, exist_ok=True)
+        Returns:
+            The ISO timestamp recorded in the saved result file
+        """
+        if save_dir not in self._save_dirs_made:
+            await asyncio.to_thread(os.makedirs, save_dir, exist_ok=True)
+            self._save_dirs_made.add(save_dir)
 
         result_file = os.path.join(save_dir, f"{self.current_task_id}_result.json")
 
+        timestamp = datetime.now(timezone.utc).isoformat()
         result_data = {
             "task_id": self.current_task_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "result": result,
             "status": "completed",
         }
 
-        with open(result_file, "w") as f:
-            json.dump(result_data, f, indent=2)
+        await asyncio.to_thread(self._write_json, result_file, result_data)
 
         logger.info(f"Results saved to: {result_file}")
+        return timestamp
+
+    @staticmethod
+    def _write_json(path: str, data: Dict[str, Any]):
+        """Write data to a JSON file (runs in a worker thread)."""
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
 
     async def stop(self):
         """Stop the currently running social media task."""
@@ -246,6 +285,16 @@ class SocialMediaAgent:
         self.stop_event.set()
         self.stopped = True
 
+    async def close(self):
+        """Close the browser kept open between runs, if any."""
+        if self.browser:
+            try:
+                await self.browser.close()
+            except Exception as e:
+                logger.error(f"Error closing browser: {e}")
+            finally:
+                self.browser = None
+
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status."""
         return {
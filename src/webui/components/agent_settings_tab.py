@@ -629,16 +629,19 @@ def _create_planner_components(env_settings):
                 interactive=True,
             )
 
+        # Env var prefix shared by the endpoint and API key lookups below
+        planner_env_prefix = (
+            str(initial_planner_llm_provider).upper()
+            if initial_planner_llm_provider
+            else ""
+        )
+
         with gr.Row():
             planner_llm_base_url = gr.Textbox(
                 label="Base URL",
                 value=(
-                    get_env_value(
-                        env_settings,
-                        f"{initial_planner_llm_provider.upper()}_ENDPOINT",
-                        "",
-                    )
-                    if initial_planner_llm_provider
+                    get_env_value(env_settings, f"{planner_env_prefix}_ENDPOINT", "")
+                    if planner_env_prefix
                     else ""
                 ),
                 info="API endpoint URL (if required)",
@@ -647,12 +650,8 @@ def _create_planner_components(env_settings):
                 label="API Key",
                 type="password",
                 value=(
-                    get_env_value(
-                        env_settings,
-                        f"{initial_planner_llm_provider.upper()}_API_KEY",
-                        "",
-                    )
-                    if initial_planner_llm_provider
+                    get_env_value(env_settings, f"{planner_env_prefix}_API_KEY", "")
+                    if planner_env_prefix
                     else ""
                 ),
                 info="Your API key (auto-saved to .env)",